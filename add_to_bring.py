@@ -16,22 +16,35 @@ Requirements:
     - python-dotenv: pip install python-dotenv
 """
 
-import argparse
+import copy
+import hashlib
 import json
 import os
+import re
 import subprocess
 import sys
-import termios
-import tty
+import time
+from contextlib import contextmanager
+from functools import cache
 from pathlib import Path
 
-# Import required dependencies
-from dotenv import load_dotenv
-from python_bring_api.bring import Bring
+# python-dotenv, python-bring-api and other heavier modules are imported in
+# the functions that use them, so dry runs and previews start quickly
+
+# orjson is optional and parses large shopping lists considerably faster
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Cached Bring! sessions are reused for just under an hour
+SESSION_TTL = 3500
 
 
 def load_config():
     """Load configuration from .env file."""
+    from dotenv import load_dotenv
+
     load_dotenv()
 
     email = os.getenv("BRING_EMAIL")
@@ -46,38 +59,39 @@ def load_config():
     return email, password, list_name
 
 
-def generate_shopping_list(recipe_files, recipes_dir=None):
-    """
-    Generate shopping list from recipe files using cooklang CLI.
+def _aisle_conf(recipes_dir):
+    """Get the aisle.conf path for a recipes directory and its mtime_ns (None if missing)"""
+    # A single stat per lookup, so an aisle.conf created or edited mid-session is picked up
+    path = recipes_dir / "config" / "aisle.conf"
+    try:
+        return path, path.stat().st_mtime_ns
+    except OSError:
+        return None, None
 
-    Args:
-        recipe_files: List of recipe file paths (can include :scale suffix)
-        recipes_dir: Directory containing recipes (defaults to current directory)
-
-    Returns:
-        List of dictionaries with category and items
-    """
-    if recipes_dir is None:
-        recipes_dir = get_recipes_dir()
-    else:
-        recipes_dir = Path(recipes_dir).expanduser().resolve()
 
+def _run_cook(recipe_files, recipes_dir):
+    """Run `cook shopping-list` on recipe files and return the parsed JSON"""
     try:
-        cmd = ["cook", "shopping-list", "-f", "json", *recipe_files]
+        cmd = ["cook", "shopping-list", "-f", "json"]
+        # Pass the recipes directory's aisle.conf explicitly so cook skips looking for it;
+        # without one, cook's own lookup (e.g. a global config) is left alone
+        aisle_path, _ = _aisle_conf(recipes_dir)
+        if aisle_path is not None:
+            cmd += ["--aisle", str(aisle_path)]
+        cmd += recipe_files
         # Run cook command in the recipes directory
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, check=True, cwd=str(recipes_dir)
-        )
+        # Keep stdout as bytes, the JSON parser decodes it directly
+        result = subprocess.run(cmd, capture_output=True, check=True, cwd=str(recipes_dir))
 
         if result.returncode != 0:
-            print(f"Error running cook command: {result.stderr}")
+            print(f"Error running cook command: {result.stderr.decode(errors='replace')}")
             sys.exit(1)
 
-        shopping_list = json.loads(result.stdout)
+        shopping_list = json_loads(result.stdout)
         return shopping_list
 
     except subprocess.CalledProcessError as e:
-        print(f"Error generating shopping list: {e.stderr}")
+        print(f"Error generating shopping list: {e.stderr.decode(errors='replace')}")
         sys.exit(1)
     except json.JSONDecodeError as e:
         print(f"Error parsing shopping list JSON: {e}")
@@ -88,6 +102,379 @@ def generate_shopping_list(recipe_files, recipes_dir=None):
         sys.exit(1)
 
 
+def _split_scale(recipe):
+    """Split a recipe argument like "recipe.cook:2" into path and scale"""
+    path, sep, scale = recipe.rpartition(":")
+    if sep and path:
+        try:
+            float(scale)
+            return path, scale
+        except ValueError:
+            pass
+    return recipe, ""
+
+
+# Recipe references (@./other or @&other) pull in files whose changes the
+# referencing recipe's mtime does not reflect
+REFERENCE_PATTERN = re.compile(r"@(?:\.{1,2}/|&)")
+
+
+def _cache_entry(recipe_files, recipes_dir):
+    """
+    Locate the cache entry for a cook invocation.
+
+    The entry is named after the sorted recipe paths and scales, so a later
+    run of the same selection overwrites it. The recipe mtimes and aisle.conf
+    (which decides the categories) are stored inside as its version.
+
+    Args:
+        recipe_files: List of recipe file paths (can include :scale suffix)
+        recipes_dir: Resolved recipes directory
+
+    Returns:
+        Tuple of (cache file, version), or (None, None) if the invocation
+        cannot be cached
+    """
+    recipes = []
+    for recipe in recipe_files:
+        path, scale = _split_scale(recipe)
+        path = (recipes_dir / path).resolve()
+        try:
+            mtime = path.stat().st_mtime_ns
+            if REFERENCE_PATTERN.search(path.read_text(encoding="utf-8")):
+                return None, None
+        except (OSError, ValueError):
+            # Let cook resolve (and report) anything that is not a readable file
+            return None, None
+        recipes.append((str(path), mtime, scale))
+    recipes.sort()
+
+    aisle_path, aisle_mtime = _aisle_conf(recipes_dir)
+    key = json.dumps([str(recipes_dir), [(path, scale) for path, _, scale in recipes]])
+    cache_file = get_cache_dir() / "recipes" / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+    version = [[mtime for _, mtime, _ in recipes], str(aisle_path), aisle_mtime]
+    return cache_file, version
+
+
+def _cook_shopping_list(recipe_files, recipes_dir):
+    """
+    Run cook on recipe files, reusing the cached result of an identical run.
+
+    Repeating a selection of unchanged recipes does not run cook again.
+
+    Args:
+        recipe_files: List of recipe file paths (can include :scale suffix)
+        recipes_dir: Resolved recipes directory
+
+    Returns:
+        List of dictionaries with category and items
+    """
+    cache_file, version = _cache_entry(recipe_files, recipes_dir)
+    if cache_file is None:
+        return _run_cook(recipe_files, recipes_dir)
+
+    try:
+        cached = json_loads(cache_file.read_bytes())
+        if cached["version"] == version:
+            return cached["shopping_list"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    shopping_list = _run_cook(recipe_files, recipes_dir)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({"version": version, "shopping_list": shopping_list}))
+    except OSError:
+        pass
+    return shopping_list
+
+
+def _is_regular_number(qty):
+    """Check whether a quantity holds a plain number that can be summed"""
+    value = qty.get("value", {})
+    return value.get("type") == "number" and value.get("value", {}).get("type") == "regular"
+
+
+def _add_item(items, item):
+    """
+    Add an item to a {name: item} mapping, merging it into an existing entry.
+
+    Mirrors how cook aggregates ingredients: quantities with the same unit are
+    summed and all others are kept side by side.
+    """
+    name = item.get("name", "")
+    if name not in items:
+        items[name] = copy.deepcopy(item)
+        return
+
+    quantities = items[name].setdefault("quantity", [])
+    for qty in item.get("quantity", []):
+        match = None
+        if _is_regular_number(qty):
+            match = next(
+                (
+                    q
+                    for q in quantities
+                    if _is_regular_number(q) and q.get("unit") == qty.get("unit")
+                ),
+                None,
+            )
+        if match is not None:
+            # Round like parsed quantities so float error (0.1 + 0.2) never shows up
+            total = match["value"]["value"]["value"] + qty["value"]["value"]["value"]
+            match["value"]["value"]["value"] = round(total, 3)
+        else:
+            quantities.append(copy.deepcopy(qty))
+
+
+def _merge_shopping_lists(shopping_lists):
+    """
+    Merge per-recipe shopping lists into one, grouping items by category and name.
+
+    Args:
+        shopping_lists: Shopping lists as returned by cook
+
+    Returns:
+        List of dictionaries with category and items
+    """
+    if len(shopping_lists) == 1:
+        return shopping_lists[0]
+
+    categories = {}
+    for shopping_list in shopping_lists:
+        for category in shopping_list:
+            items = categories.setdefault(category.get("category", "other"), {})
+            for item in category.get("items", []):
+                _add_item(items, item)
+
+    return [
+        {"category": category, "items": list(items.values())}
+        for category, items in categories.items()
+    ]
+
+
+class UnsupportedRecipeError(Exception):
+    """Raised when a recipe uses syntax that only the cooklang CLI handles"""
+
+
+# Ingredients are either "@name{quantity%unit}" (name may contain spaces) or a
+# single word like "@salt". Leading characters are cooklang modifiers. An "@"
+# inside a word, as in an email address, does not start an ingredient.
+INGREDIENT_PATTERN = re.compile(
+    r"(?<!\w)@(?P<modifiers>[&?+\-]*)(?:(?P<name>[^@#~{}\n]+?)\{(?P<quantity>[^}]*)\}|(?P<word>\w+))"
+)
+
+
+# Parsed aisle.conf files by path, as (mtime_ns, categories, lookup)
+_aisle_cache = {}
+
+
+def _load_aisle(recipes_dir):
+    """
+    Load aisle.conf for the recipes directory.
+
+    The parsed file is kept in memory and only read again when it changes.
+
+    Returns:
+        Tuple of (category names in file order, {lowercased name: (category, canonical name)})
+    """
+    path, mtime = _aisle_conf(recipes_dir)
+    if path is None:
+        return [], {}
+
+    cached = _aisle_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+
+    categories = []
+    lookup = {}
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return categories, lookup
+
+    category = None
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            category = line[1:-1].strip()
+            categories.append(category)
+        elif category is not None:
+            # Synonyms are listed as "name|synonym|..." and merged under the first name
+            names = [name.strip() for name in line.split("|") if name.strip()]
+            for name in names:
+                lookup.setdefault(name.lower(), (category, names[0] if len(names) > 1 else None))
+
+    _aisle_cache[path] = (mtime, categories, lookup)
+    return categories, lookup
+
+
+def _parse_number(text):
+    """Parse "2", "1.5", "1/2" or "1 1/2" into a float, or None for anything else"""
+    try:
+        return float(text)
+    except ValueError:
+        pass
+
+    whole, _, fraction = text.rpartition(" ")
+    numerator, sep, denominator = fraction.partition("/")
+    if not sep:
+        return None
+    try:
+        return (int(whole) if whole else 0) + int(numerator) / int(denominator)
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def _parse_quantity(text, scale):
+    """Convert a cooklang quantity ("2%cups", "=1%tsp", "some") into cook's JSON format"""
+    amount, _, unit = text.partition("%")
+    amount = amount.strip()
+    if not amount:
+        return None
+
+    # "=" marks a fixed quantity that is not scaled, a trailing "*" a scaled one
+    fixed = amount.startswith("=")
+    amount = amount.lstrip("=").rstrip("*").strip()
+    number = _parse_number(amount)
+    if number is None:
+        return {"value": {"type": "text", "value": amount}, "unit": unit.strip() or None}
+
+    if not fixed:
+        number *= scale
+    return {
+        "value": {"type": "number", "value": {"type": "regular", "value": round(number, 3)}},
+        "unit": unit.strip() or None,
+    }
+
+
+def _strip_non_steps(text):
+    """Remove front matter, metadata, notes and comments from recipe text"""
+    if text.startswith("---\n"):
+        end = text.find("\n---", 4)
+        if end != -1:
+            text = text[end + 4 :]
+
+    text = re.sub(r"\[-.*?-\]", "", text, flags=re.DOTALL)
+    lines = []
+    for line in text.splitlines():
+        # ">> key: value" metadata and "> note" lines hold no ingredients
+        if line.lstrip().startswith(">"):
+            continue
+        lines.append(line.split("--", 1)[0])
+    return "\n".join(lines)
+
+
+def _shopping_list_in_process(recipe, recipes_dir):
+    """
+    Generate the shopping list of a single recipe without running cook.
+
+    Args:
+        recipe: Recipe file path (can include :scale suffix)
+        recipes_dir: Resolved recipes directory
+
+    Returns:
+        List of dictionaries with category and items, in the same format as cook
+
+    Raises:
+        UnsupportedRecipeError: If the recipe needs the cooklang CLI (missing file,
+            references to other recipes)
+    """
+    path, scale = _split_scale(recipe)
+    try:
+        text = (recipes_dir / path).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        raise UnsupportedRecipeError(recipe) from e
+
+    aisle_categories, aisle_lookup = _load_aisle(recipes_dir)
+    factor = float(scale) if scale else 1.0
+
+    categories = {}
+    for match in INGREDIENT_PATTERN.finditer(_strip_non_steps(text)):
+        name = (match.group("name") or match.group("word")).strip()
+        if match.group("modifiers").startswith("&") or "/" in name:
+            # References to other recipes or ingredients are resolved by cook
+            raise UnsupportedRecipeError(recipe)
+
+        # "@name|alias{}" lists the ingredient under its name
+        name = name.split("|", 1)[0].strip()
+        category, canonical = aisle_lookup.get(name.lower(), ("other", None))
+        quantity = _parse_quantity(match.group("quantity") or "", factor)
+        _add_item(
+            categories.setdefault(category, {}),
+            {"name": canonical or name, "quantity": [quantity] if quantity else []},
+        )
+
+    order = {category: i for i, category in enumerate(aisle_categories)}
+    return [
+        {"category": category, "items": list(items.values())}
+        for category, items in sorted(categories.items(), key=lambda c: order.get(c[0], len(order)))
+    ]
+
+
+def generate_shopping_list(recipe_files, recipes_dir=None, fast_parser=False):
+    """
+    Generate shopping list from recipe files using cooklang CLI.
+
+    With fast_parser, recipes are parsed in-process instead, and cook only
+    runs (once) for those the built-in parser cannot handle.
+
+    Args:
+        recipe_files: List of recipe file paths (can include :scale suffix)
+        recipes_dir: Directory containing recipes (defaults to current directory)
+        fast_parser: Use the built-in parser instead of cook where possible
+
+    Returns:
+        List of dictionaries with category and items
+    """
+    if recipes_dir is None:
+        recipes_dir = get_recipes_dir()
+    else:
+        recipes_dir = Path(recipes_dir).expanduser().resolve()
+
+    if not fast_parser:
+        return merge_duplicate_items(_cook_shopping_list(recipe_files, recipes_dir))
+
+    shopping_lists = []
+    unsupported = []
+    for recipe in recipe_files:
+        try:
+            shopping_lists.append(_shopping_list_in_process(recipe, recipes_dir))
+        except UnsupportedRecipeError:
+            unsupported.append(recipe)
+
+    if unsupported:
+        shopping_lists.append(_cook_shopping_list(unsupported, recipes_dir))
+    return merge_duplicate_items(_merge_shopping_lists(shopping_lists))
+
+
+def merge_duplicate_items(shopping_list):
+    """
+    Merge items whose names differ only in case or surrounding whitespace.
+
+    Keeps the first spelling of each name and combines quantities the same
+    way recipes are aggregated, so "Milk" and "milk " become a single item.
+
+    Args:
+        shopping_list: List of dictionaries with category and items
+
+    Returns:
+        List of dictionaries with category and items
+    """
+    merged = []
+    for category in shopping_list:
+        items = {}
+        names = {}
+        for item in category.get("items", []):
+            name = item.get("name", "")
+            name = names.setdefault(name.lower().strip(), name.strip())
+            _add_item(items, {**item, "name": name})
+        merged.append({**category, "items": list(items.values())})
+    return merged
+
+
 def filter_staples(shopping_list):
     """
     Filter out items in the 'staples' category from the shopping list.
@@ -99,9 +486,16 @@ def filter_staples(shopping_list):
         shopping_list: List of dictionaries with category and items
 
     Returns:
-        Filtered shopping list without staples category
+        Tuple of (filtered shopping list without staples category, number of staple items)
     """
-    return [cat for cat in shopping_list if cat.get("category", "").lower() != "staples"]
+    kept = []
+    staples_count = 0
+    for cat in shopping_list:
+        if cat.get("category", "").lower() == "staples":
+            staples_count += len(cat.get("items", []))
+        else:
+            kept.append(cat)
+    return kept, staples_count
 
 
 def format_quantity(quantity_list):
@@ -118,56 +512,254 @@ def format_quantity(quantity_list):
         return ""
 
     parts = []
+    append = parts.append
     for qty in quantity_list:
-        value = qty.get("value", {})
-        if value.get("type") == "number":
-            num_value = value.get("value", {}).get("value", "")
-            unit = qty.get("unit", "")
+        # Direct subscripts are cheaper than chained .get() with default dicts
+        try:
+            value = qty["value"]
+            if value["type"] != "number":
+                continue
+            num_value = value["value"]["value"]
+        except (KeyError, TypeError):
+            continue
 
-            if num_value:
-                if unit:
-                    parts.append(f"{num_value} {unit}")
-                else:
-                    parts.append(str(num_value))
+        if num_value:
+            unit = qty.get("unit")
+            append(f"{num_value} {unit}" if unit else str(num_value))
 
     return ", ".join(parts)
 
 
-def add_to_bring(shopping_list, email, password, list_name=""):
+def get_parallelism():
+    """Get the number of concurrent Bring! requests from environment (defaults to 8)"""
+    try:
+        return max(1, int(os.environ.get("BRING_PARALLELISM", "8")))
+    except ValueError:
+        return 8
+
+
+def _bulk_add_items(bring, list_uuid, items):
     """
-    Add items from shopping list to Bring! app.
+    Add items to a Bring! list with a single request to the batch endpoint.
+
+    python-bring-api only wraps the single-item endpoint, so the request is
+    built here using the headers of the logged-in Bring instance.
+
+    Args:
+        bring: Logged-in Bring instance
+        list_uuid: UUID of the target list
+        items: List of (name, specification) tuples
+    """
+    import urllib.request
+
+    changes = [
+        {
+            "accuracy": "0.0",
+            "altitude": "0.0",
+            "latitude": "0.0",
+            "longitude": "0.0",
+            "itemId": name,
+            "spec": spec,
+            "operation": "TO_PURCHASE",
+        }
+        for name, spec in items
+    ]
+    request = urllib.request.Request(
+        f"{bring.url}bringlists/{list_uuid}/items",
+        data=json.dumps({"changes": changes, "sender": ""}).encode(),
+        headers={**bring.headers, "Content-Type": "application/json; charset=UTF-8"},
+        method="PUT",
+    )
+    with urllib.request.urlopen(request, timeout=30):
+        pass
+
+
+def upload_items(bring, list_uuid, items, on_result):
+    """
+    Upload items to a Bring! list.
+
+    Sends everything in one batch request and falls back to concurrent
+    saveItem calls (BRING_PARALLELISM at a time) if the batch request fails.
+
+    Args:
+        bring: Logged-in Bring instance
+        list_uuid: UUID of the target list
+        items: List of (name, specification) tuples
+        on_result: Called as on_result(index, error) for every item as soon as
+            its result is known, with error None on success
+
+    Returns:
+        List with one entry per item: None on success, the exception on failure
+    """
+    if not items:
+        return []
+
+    try:
+        _bulk_add_items(bring, list_uuid, items)
+    except Exception as e:
+        # Single requests would be rejected just the same, let the caller log in again
+        if _is_auth_error(e):
+            raise
+    else:
+        for index in range(len(items)):
+            on_result(index, None)
+        return [None] * len(items)
+
+    def save(item):
+        # Bring keeps the aiohttp session of the running call on the instance,
+        # so every concurrent call needs its own shallow copy
+        name, spec = item
+        try:
+            copy.copy(bring).saveItem(list_uuid, name, spec)
+            return None
+        except Exception as e:
+            return e
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    errors = [None] * len(items)
+    with ThreadPoolExecutor(max_workers=get_parallelism()) as executor:
+        futures = {executor.submit(save, item): index for index, item in enumerate(items)}
+        # Results are reported from this thread only, so output never interleaves
+        for future in as_completed(futures):
+            index = futures[future]
+            errors[index] = future.result()
+            on_result(index, errors[index])
+    return errors
+
+
+def get_cache_dir():
+    """Get the cache directory from XDG_CACHE_HOME or default to ~/.cache"""
+    return Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / "cooklang-bring"
+
+
+def load_session(email):
+    """Load the cached Bring! session for an account, if present and unexpired"""
+    try:
+        session = json.loads((get_cache_dir() / "session.json").read_text())
+    except (OSError, ValueError):
+        return None
+
+    if session.get("email") != email or session.get("expires_at", 0) < time.time():
+        return None
+    return session
+
+
+def save_session(session):
+    """Write the Bring! session to the cache, readable only by the current user"""
+    path = get_cache_dir() / "session.json"
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        # The mode above only applies to new files, tighten existing ones too
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(session, f)
+    except OSError:
+        # Caching is best effort, the next run simply logs in again
+        pass
+
+
+def clear_session():
+    """Remove the cached Bring! session"""
+    (get_cache_dir() / "session.json").unlink(missing_ok=True)
+
+
+def _is_auth_error(error):
+    """Check whether a request failed because the access token was rejected"""
+    while error is not None:
+        if getattr(error, "status", None) == 401 or getattr(error, "code", None) == 401:
+            return True
+        error = error.__cause__
+    return False
+
+
+def connect_to_bring(email, password, list_name="", use_cache=True):
+    """
+    Log in to Bring! and select the target list.
+
+    A session cached by a previous run is reused while it is valid, which
+    skips the login and loadLists requests entirely.
 
     Args:
-        shopping_list: Shopping list from cooklang
         email: Bring! account email
         password: Bring! account password
         list_name: Optional specific list name (uses first list if not specified)
+        use_cache: Whether a cached session may be reused
+
+    Returns:
+        Tuple of (Bring instance, target list, whether the session came from cache)
     """
-    try:
+    from python_bring_api.bring import Bring
+
+    bring = Bring(email, password)
+    session = load_session(email) if use_cache else None
+    from_cache = session is not None
+
+    if session is not None:
+        bring.uuid = session["uuid"]
+        bring.publicUuid = session["public_uuid"]
+        bring.headers = session["headers"]
+        bring.putHeaders = session["put_headers"]
+        bring.postHeaders = session["post_headers"]
+    else:
         # Login to Bring!
-        bring = Bring(email, password)
         bring.login()
 
         # Get available lists
         lists_data = bring.loadLists()
-        lists = lists_data.get("lists", [])
-
-        if not lists:
-            print("Error: No shopping lists found in your Bring! account")
-            sys.exit(1)
+        session = {
+            "email": email,
+            "uuid": bring.uuid,
+            "public_uuid": bring.publicUuid,
+            "headers": bring.headers,
+            "put_headers": bring.putHeaders,
+            "post_headers": bring.postHeaders,
+            "lists": lists_data.get("lists", []),
+            "targets": {},
+            "expires_at": time.time() + SESSION_TTL,
+        }
+
+    lists = session["lists"]
+    if not lists:
+        print("Error: No shopping lists found in your Bring! account")
+        sys.exit(1)
 
-        # Select target list
-        target_list = None
+    # Select target list
+    target_list = session["targets"].get(list_name.lower())
+    if target_list is None:
         if list_name:
             for lst in lists:
                 if lst["name"].lower() == list_name.lower():
                     target_list = lst
+                    session["targets"][list_name.lower()] = lst
                     break
             if not target_list:
+                if from_cache:
+                    # The list may have been created after the session was cached
+                    return connect_to_bring(email, password, list_name, use_cache=False)
                 print(f"Warning: List '{list_name}' not found. Using first available list.")
                 target_list = lists[0]
         else:
             target_list = lists[0]
+            session["targets"][""] = target_list
+
+    save_session(session)
+    return bring, target_list, from_cache
+
+
+def add_to_bring(shopping_list, email, password, list_name=""):
+    """
+    Add items from shopping list to Bring! app.
+
+    Args:
+        shopping_list: Shopping list from cooklang
+        email: Bring! account email
+        password: Bring! account password
+        list_name: Optional specific list name (uses first list if not specified)
+    """
+    try:
+        bring, target_list, from_cache = connect_to_bring(email, password, list_name)
 
         list_uuid = target_list["listUuid"]
         list_display_name = target_list["name"]
@@ -175,35 +767,52 @@ def add_to_bring(shopping_list, email, password, list_name=""):
         print(f"Adding items to Bring! list: {list_display_name}")
         print("-" * 50)
 
-        # Add items to Bring!
-        total_items = 0
-        for category in shopping_list:
+        # Prepare all items up front so they can be uploaded in one request
+        prepared = []
+        for category in merge_duplicate_items(shopping_list):
             category_name = category.get("category", "other")
-            items = category.get("items", [])
+            for item in category.get("items", []):
+                item_name = item.get("name", "")
+                # Format specification (quantity info)
+                spec = format_quantity(item.get("quantity", []))
+                prepared.append((category_name, item_name, spec))
 
-            if items:
-                print(f"\n{category_name.upper()}:")
+        current_category = None
 
-            for item in items:
-                item_name = item.get("name", "")
-                quantity = item.get("quantity", [])
+        def report(index, error):
+            # Items arrive in list order from the batch request but in completion
+            # order from the fallback, where a category header may then repeat
+            nonlocal current_category
+            category_name, item_name, spec = prepared[index]
+            if category_name != current_category:
+                print(f"\n{category_name.upper()}:")
+                current_category = category_name
 
-                # Format specification (quantity info)
-                spec = format_quantity(quantity)
-
-                # Add to Bring!
-                try:
-                    bring.saveItem(list_uuid, item_name, spec)
-                    display = f"  ✓ {item_name}"
-                    if spec:
-                        display += f" ({spec})"
-                    print(display)
-                    total_items += 1
-                except Exception as e:
-                    print(f"  ✗ Failed to add {item_name}: {e}")
+            if error is None:
+                display = f"  ✓ {item_name}"
+                if spec:
+                    display += f" ({spec})"
+                print(display)
+            else:
+                print(f"  ✗ Failed to add {item_name}: {error}")
 
-        print("-" * 50)
-        print(f"Successfully added {total_items} items to '{list_display_name}'")
+        # Add to Bring!
+        items = [(name, spec) for _, name, spec in prepared]
+        try:
+            errors = upload_items(bring, list_uuid, items, report)
+        except Exception as e:
+            if not (from_cache and _is_auth_error(e)):
+                raise
+            # Cached session was rejected: log in again and retry once
+            clear_session()
+            bring, target_list, _ = connect_to_bring(email, password, list_name, use_cache=False)
+            errors = upload_items(bring, target_list["listUuid"], items, report)
+        total_items = errors.count(None)
+
+        # The per-item lines above stay live, only the closing summary is batched
+        sys.stdout.write(
+            f"{'-' * 50}\nSuccessfully added {total_items} items to '{list_display_name}'\n"
+        )
 
     except Exception as e:
         print(f"Error connecting to Bring!: {e}")
@@ -211,29 +820,60 @@ def add_to_bring(shopping_list, email, password, list_name=""):
 
 
 # Interactive mode functions
-def getch():
-    """Get a single character from user without requiring Enter"""
+
+# Menu value for rescanning the recipes directory
+REFRESH_CHOICE = object()
+
+
+@contextmanager
+def cbreak():
+    """Put the terminal in cbreak mode (unbuffered, no echo) for the duration of the block"""
+    import termios
+    import tty
+
     fd = sys.stdin.fileno()
     old_settings = termios.tcgetattr(fd)
     try:
-        tty.setraw(fd)
-        ch = sys.stdin.read(1)
+        tty.setcbreak(fd)
+        yield
     finally:
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-    return ch
+
+
+def read_key(choices):
+    """Read single keys without requiring Enter until one of choices is pressed"""
+    with cbreak():
+        while True:
+            ch = sys.stdin.read(1).lower()
+            if ch in choices:
+                return ch
 
 
 def clear_screen():
     """Clear the terminal screen"""
-    os.system("clear" if os.name != "nt" else "cls")
+    # Write the ANSI sequence directly where the terminal understands it
+    # (Windows only in Windows Terminal) instead of spawning a shell
+    if (
+        sys.stdout.isatty()
+        and os.environ.get("TERM") != "dumb"
+        and (os.name != "nt" or os.environ.get("WT_SESSION"))
+    ):
+        sys.stdout.write("\x1b[H\x1b[2J\x1b[3J")
+        sys.stdout.flush()
+    else:
+        os.system("clear" if os.name != "nt" else "cls")
+
+
+def format_context(context_dict):
+    """Format current selection context"""
+    lines = ["", "━━━ Add Recipes to Bring! Shopping List ━━━", ""]
+    lines.extend(f"{key}: {value}" for key, value in context_dict.items() if value is not None)
+    return "\n".join(lines) + "\n"
 
 
 def show_context(context_dict):
     """Show current selection context"""
-    print("\n━━━ Add Recipes to Bring! Shopping List ━━━\n")
-    for key, value in context_dict.items():
-        if value is not None:
-            print(f"{key}: {value}")
+    sys.stdout.write(format_context(context_dict))
 
 
 def get_recipes_dir():
@@ -251,19 +891,32 @@ def get_kitchens(recipes_dir=None):
     else:
         recipes_dir = Path(recipes_dir).expanduser().resolve()
 
-    # Find all subdirectories that contain .cook files
+    return list(_scan_kitchens(str(recipes_dir)))
+
+
+@cache
+def _scan_kitchens(recipes_dir):
+    """Scan a recipes directory for kitchens, cached for the rest of the session"""
+    # Find all subdirectories that contain .cook files. scandir entries carry
+    # the file type from readdir, so this needs no extra stat calls.
     kitchens = []
-    for item in recipes_dir.iterdir():
-        if (
-            item.is_dir()
-            and not item.name.startswith(".")
-            and not item.name.startswith("_")
-            and list(item.glob("*.cook"))
-        ):
-            # Directory contains .cook files
-            kitchens.append(item.name)
+    with os.scandir(recipes_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith((".", "_")) or not entry.is_dir():
+                continue
 
-    return sorted(kitchens)
+            try:
+                with os.scandir(entry.path) as kitchen_entries:
+                    has_recipes = any(e.name.endswith(".cook") for e in kitchen_entries)
+            except OSError:
+                # Skip directories we cannot read
+                continue
+
+            if has_recipes:
+                # Directory contains .cook files
+                kitchens.append(entry.name)
+
+    return tuple(sorted(kitchens))
 
 
 def get_recipes_in_kitchen(kitchen, recipes_dir=None):
@@ -273,39 +926,49 @@ def get_recipes_in_kitchen(kitchen, recipes_dir=None):
     else:
         recipes_dir = Path(recipes_dir).expanduser().resolve()
 
-    kitchen_path = recipes_dir / kitchen
-    recipes = []
+    return list(_scan_recipes(kitchen, str(recipes_dir)))
+
 
-    for recipe_file in sorted(kitchen_path.glob("*.cook")):
+@cache
+def _scan_recipes(kitchen, recipes_dir):
+    """Scan a kitchen directory for recipes, cached for the rest of the session"""
+    with os.scandir(Path(recipes_dir) / kitchen) as entries:
+        filenames = sorted(e.name for e in entries if e.name.endswith(".cook"))
+
+    recipes = []
+    for filename in filenames:
         # Convert filename to display name
-        display_name = recipe_file.stem.replace("-", " ").replace("_", " ").title()
-        recipes.append((recipe_file.name, display_name))
+        display_name = filename[: -len(".cook")].replace("-", " ").replace("_", " ").title()
+        recipes.append((filename, display_name))
+
+    return tuple(recipes)
 
-    return recipes
+
+def refresh_recipes():
+    """Forget cached kitchen and recipe listings so the next lookup rescans the disk"""
+    _scan_kitchens.cache_clear()
+    _scan_recipes.cache_clear()
 
 
 def select_from_list(items, prompt, context=None, allow_back=False):
     """Display a selection list with numbered options"""
-    clear_screen()
-
+    # Render the whole menu once and write it in one go; invalid input below
+    # only prints an error line instead of redrawing the menu
+    body = "\n".join(f"│ {i:2d}. {display}" for i, (_value, display) in enumerate(items, 1))
+    screen = f"\n┌─ {prompt}\n│\n{body}\n│\n"
     if context:
-        show_context(context)
-
-    print(f"\n┌─ {prompt}")
-    print("│")
+        screen = format_context(context) + screen
 
-    for i, (_value, display) in enumerate(items, 1):
-        print(f"│ {i:2d}. {display}")
+    prompt_text = "└─ Enter number"
+    if allow_back:
+        prompt_text += " (or 'b' to go back)"
+    prompt_text += " (or 'q' to quit): "
 
-    print("│")
+    clear_screen()
+    sys.stdout.write(screen)
 
     while True:
         try:
-            prompt_text = "└─ Enter number"
-            if allow_back:
-                prompt_text += " (or 'b' to go back)"
-            prompt_text += " (or 'q' to quit): "
-
             choice = input(prompt_text).strip()
 
             if choice.lower() == "q":
@@ -353,32 +1016,34 @@ def get_scaling_factor(context=None):
             print("   Please enter a valid number")
 
 
-def show_shopping_list_preview(shopping_list):
-    """Display shopping list preview"""
-    print("\n" + "=" * 50)
-    print("SHOPPING LIST PREVIEW")
-    print("=" * 50)
-
+def format_shopping_list(shopping_list):
+    """Format shopping list items as lines grouped under category headers"""
+    lines = []
+    append = lines.append
     for category in shopping_list:
         category_name = category.get("category", "other")
         items = category.get("items", [])
 
         if items:
-            print(f"\n{category_name.upper()}:")
+            append(f"\n{category_name.upper()}:")
             for item in items:
                 item_name = item.get("name", "")
-                quantity = item.get("quantity", [])
-                spec = format_quantity(quantity)
+                spec = format_quantity(item.get("quantity", []))
+                append(f"  • {item_name} ({spec})" if spec else f"  • {item_name}")
 
-                display = f"  • {item_name}"
-                if spec:
-                    display += f" ({spec})"
-                print(display)
+    return lines
 
-    print("=" * 50)
+
+def show_shopping_list_preview(shopping_list):
+    """Display shopping list preview"""
+    # Written in one go rather than one print per item
+    lines = ["", "=" * 50, "SHOPPING LIST PREVIEW", "=" * 50]
+    lines.extend(format_shopping_list(shopping_list))
+    lines.append("=" * 50)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def interactive_mode(recipes_dir=None):
+def interactive_mode(recipes_dir=None, fast_parser=False):
     """Run in interactive mode to select recipes"""
     if recipes_dir is None:
         recipes_dir = get_recipes_dir()
@@ -392,19 +1057,10 @@ def interactive_mode(recipes_dir=None):
     print()
 
     selected_recipes = []
+    recipe_display_parts = []
     context = {}
 
     while True:
-        # Show currently selected recipes
-        if selected_recipes:
-            recipe_list = ", ".join(
-                [
-                    f"{r['display']}" + (f" (x{r['scale']:.1f})" if r["scale"] != 1.0 else "")
-                    for r in selected_recipes
-                ]
-            )
-            context["Selected Recipes"] = recipe_list
-
         # Select kitchen
         kitchens = get_kitchens(recipes_dir)
         if not kitchens:
@@ -412,6 +1068,7 @@ def interactive_mode(recipes_dir=None):
             sys.exit(1)
 
         kitchen_items = [(k, k) for k in kitchens]
+        kitchen_items.append((REFRESH_CHOICE, "↻ Refresh recipe list"))
         selected_kitchen = select_from_list(
             kitchen_items, "Select Kitchen", context, allow_back=False
         )
@@ -419,6 +1076,10 @@ def interactive_mode(recipes_dir=None):
         if not selected_kitchen:
             continue
 
+        if selected_kitchen is REFRESH_CHOICE:
+            refresh_recipes()
+            continue
+
         context_with_kitchen = context.copy()
         context_with_kitchen["Kitchen"] = selected_kitchen
 
@@ -450,18 +1111,14 @@ def interactive_mode(recipes_dir=None):
         if scale != 1.0:
             recipe_path += f":{scale}"
 
-        selected_recipes.append(
-            {"path": recipe_path, "display": f"{selected_kitchen}/{recipe_display}", "scale": scale}
-        )
+        selected_recipes.append(recipe_path)
 
-        # Update context
-        recipe_list = ", ".join(
-            [
-                f"{r['display']}" + (f" (x{r['scale']:.1f})" if r["scale"] != 1.0 else "")
-                for r in selected_recipes
-            ]
-        )
-        context["Selected Recipes"] = recipe_list
+        # Update context with the newly selected recipe
+        display = f"{selected_kitchen}/{recipe_display}"
+        if scale != 1.0:
+            display += f" (x{scale:.1f})"
+        recipe_display_parts.append(display)
+        context["Selected Recipes"] = ", ".join(recipe_display_parts)
 
         # Ask to add another recipe
         clear_screen()
@@ -470,11 +1127,8 @@ def interactive_mode(recipes_dir=None):
         print("│")
         print("└─ (y/n): ", end="", flush=True)
 
-        while True:
-            another = getch().lower()
-            if another in ("y", "n"):
-                print(another)
-                break
+        another = read_key(("y", "n"))
+        print(another)
 
         if another != "y":
             break
@@ -487,22 +1141,16 @@ def interactive_mode(recipes_dir=None):
     clear_screen()
     print("\n━━━ Generating Shopping List ━━━\n")
 
-    recipe_paths = [r["path"] for r in selected_recipes]
-    shopping_list = generate_shopping_list(recipe_paths, recipes_dir)
+    shopping_list = generate_shopping_list(selected_recipes, recipes_dir, fast_parser)
 
     if not shopping_list:
         print("No items found in shopping list.")
         sys.exit(0)
 
     # Filter staples
-    staples_category = next(
-        (cat for cat in shopping_list if cat.get("category", "").lower() == "staples"), None
-    )
-    if staples_category:
-        staples_count = len(staples_category.get("items", []))
-        if staples_count > 0:
-            print(f"Filtered {staples_count} staple item(s) (already in pantry)")
-    shopping_list = filter_staples(shopping_list)
+    shopping_list, staples_count = filter_staples(shopping_list)
+    if staples_count > 0:
+        print(f"Filtered {staples_count} staple item(s) (already in pantry)")
 
     # Show preview
     show_shopping_list_preview(shopping_list)
@@ -512,11 +1160,8 @@ def interactive_mode(recipes_dir=None):
     print("│")
     print("└─ (y/n): ", end="", flush=True)
 
-    while True:
-        send = getch().lower()
-        if send in ("y", "n"):
-            print(send)
-            break
+    send = read_key(("y", "n"))
+    print(send)
 
     if send == "y":
         email, password, list_name = load_config()
@@ -525,6 +1170,20 @@ def interactive_mode(recipes_dir=None):
         print("\nShopping list not sent to Bring!")
 
 
+def read_recipes_file(path):
+    """Read recipe paths from a file, one per line (blank lines and # comments are skipped)"""
+    try:
+        if path == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            lines = Path(path).expanduser().read_text().splitlines()
+    except OSError as e:
+        print(f"Error reading recipes file: {e}")
+        sys.exit(1)
+
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+
+
 def main():
     # If no arguments provided, run in interactive mode with default recipes dir
     if len(sys.argv) == 1:
@@ -535,6 +1194,8 @@ def main():
             sys.exit(0)
         return
 
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Add Cooklang recipes to Bring! shopping list",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -546,6 +1207,7 @@ Examples:
   %(prog)s recipe.cook:2              # Double the recipe
   %(prog)s recipes/*.cook
   %(prog)s -d --list recipes/*.cook   # Dry run to see what would be added
+  %(prog)s --recipes-file week.txt    # Recipes listed one per line
 
 Configuration:
   Create a .env file with:
@@ -561,6 +1223,12 @@ Configuration:
         help="Recipe files to add (supports :scale suffix, e.g., recipe.cook:2). Leave empty for interactive mode.",
     )
 
+    parser.add_argument(
+        "-f",
+        "--recipes-file",
+        help="File with one recipe per line (same syntax as positional recipes, '-' for stdin)",
+    )
+
     parser.add_argument(
         "-d",
         "--dry-run",
@@ -576,6 +1244,13 @@ Configuration:
         help="Include staples (salt, pepper, water, oil, etc.) in the shopping list",
     )
 
+    parser.add_argument(
+        "--fast-parser",
+        action="store_true",
+        help="Parse recipes with the built-in parser instead of the cooklang CLI (experimental, "
+        "no unit conversion)",
+    )
+
     parser.add_argument(
         "-r",
         "--recipes-dir",
@@ -584,10 +1259,16 @@ Configuration:
 
     args = parser.parse_args()
 
+    if args.recipes_file:
+        args.recipes.extend(read_recipes_file(args.recipes_file))
+        if not args.recipes:
+            print(f"No recipes found in {args.recipes_file}")
+            sys.exit(0)
+
     # If no recipes provided, run in interactive mode
     if not args.recipes:
         try:
-            interactive_mode(args.recipes_dir)
+            interactive_mode(args.recipes_dir, args.fast_parser)
         except KeyboardInterrupt:
             print("\n\nCancelled by user.")
             sys.exit(0)
@@ -595,7 +1276,7 @@ Configuration:
 
     # Generate shopping list
     print("Generating shopping list from recipes...")
-    shopping_list = generate_shopping_list(args.recipes, args.recipes_dir)
+    shopping_list = generate_shopping_list(args.recipes, args.recipes_dir, args.fast_parser)
 
     if not shopping_list:
         print("No items found in shopping list. Check your recipe files.")
@@ -603,38 +1284,16 @@ Configuration:
 
     # Filter out staples unless requested
     if not args.include_staples:
-        # Count staples before filtering
-        staples_category = next(
-            (cat for cat in shopping_list if cat.get("category", "").lower() == "staples"), None
-        )
-        if staples_category:
-            staples_count = len(staples_category.get("items", []))
-            if staples_count > 0:
-                print(
-                    f"Filtered {staples_count} staple item(s) (use --include-staples to show them)"
-                )
-        shopping_list = filter_staples(shopping_list)
+        shopping_list, staples_count = filter_staples(shopping_list)
+        if staples_count > 0:
+            print(f"Filtered {staples_count} staple item(s) (use --include-staples to show them)")
 
     # Show list if requested
     if args.list or args.dry_run:
-        print("\nShopping List:")
-        print("=" * 50)
-        for category in shopping_list:
-            category_name = category.get("category", "other")
-            items = category.get("items", [])
-
-            if items:
-                print(f"\n{category_name.upper()}:")
-                for item in items:
-                    item_name = item.get("name", "")
-                    quantity = item.get("quantity", [])
-                    spec = format_quantity(quantity)
-
-                    display = f"  • {item_name}"
-                    if spec:
-                        display += f" ({spec})"
-                    print(display)
-        print("=" * 50)
+        lines = ["", "Shopping List:", "=" * 50]
+        lines.extend(format_shopping_list(shopping_list))
+        lines.append("=" * 50)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # Add to Bring! unless dry-run
     if not args.dry_run:
@@ -0,0 +1,215 @@
+"""Tests for add_to_bring."""
+
+import pytest
+
+import add_to_bring
+
+SHOPPING_LIST = [{"category": "produce", "items": [{"name": "onion", "quantity": []}]}]
+
+
+def count_cook_runs(monkeypatch, tmp_path):
+    """Cache into tmp_path and record the recipe files of every cook run."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    runs = []
+
+    def run_cook(recipe_files, recipes_dir):
+        runs.append(list(recipe_files))
+        return SHOPPING_LIST
+
+    monkeypatch.setattr(add_to_bring, "_run_cook", run_cook)
+    return runs
+
+
+def test_repeated_invocation_is_served_from_cache(monkeypatch, tmp_path):
+    runs = count_cook_runs(monkeypatch, tmp_path)
+    (tmp_path / "a.cook").write_text("Chop @onion{1}.\n")
+    (tmp_path / "b.cook").write_text("Add @salt.\n")
+
+    first = add_to_bring.generate_shopping_list(["a.cook", "b.cook:2"], tmp_path)
+    second = add_to_bring.generate_shopping_list(["b.cook:2", "a.cook"], tmp_path)
+
+    assert first == second == SHOPPING_LIST
+    assert runs == [["a.cook", "b.cook:2"]]
+
+
+def test_changed_recipe_reruns_cook_for_all_recipes(monkeypatch, tmp_path):
+    runs = count_cook_runs(monkeypatch, tmp_path)
+    (tmp_path / "a.cook").write_text("Chop @onion{1}.\n")
+    (tmp_path / "b.cook").write_text("Add @salt.\n")
+
+    add_to_bring.generate_shopping_list(["a.cook", "b.cook"], tmp_path)
+    (tmp_path / "b.cook").write_text("Add @pepper.\n")
+    add_to_bring.generate_shopping_list(["a.cook", "b.cook"], tmp_path)
+
+    assert runs == [["a.cook", "b.cook"], ["a.cook", "b.cook"]]
+    assert len(list((tmp_path / "cache" / "cooklang-bring" / "recipes").iterdir())) == 1
+
+
+def test_recipes_with_references_are_not_cached(monkeypatch, tmp_path):
+    runs = count_cook_runs(monkeypatch, tmp_path)
+    (tmp_path / "a.cook").write_text("Make @./dough{} first.\n")
+
+    add_to_bring.generate_shopping_list(["a.cook"], tmp_path)
+    add_to_bring.generate_shopping_list(["a.cook"], tmp_path)
+
+    assert runs == [["a.cook"], ["a.cook"]]
+
+
+def test_unreadable_kitchen_is_skipped(tmp_path, monkeypatch):
+    for kitchen in ("German", "Locked"):
+        (tmp_path / kitchen).mkdir()
+        (tmp_path / kitchen / "soup.cook").touch()
+
+    scandir = add_to_bring.os.scandir
+
+    def scandir_denying_locked(path):
+        if str(path).endswith("Locked"):
+            raise PermissionError(path)
+        return scandir(path)
+
+    monkeypatch.setattr(add_to_bring.os, "scandir", scandir_denying_locked)
+
+    assert add_to_bring.get_kitchens(tmp_path) == ["German"]
+
+
+def number(value, unit=None):
+    """Build a quantity in cook's JSON format."""
+    return {"value": {"type": "number", "value": {"type": "regular", "value": value}}, "unit": unit}
+
+
+def parse(tmp_path, text, recipe="recipe.cook"):
+    """Parse recipe text with the built-in parser."""
+    (tmp_path / "recipe.cook").write_text(text)
+    return add_to_bring._shopping_list_in_process(recipe, tmp_path)
+
+
+def test_braced_and_single_word_ingredients(tmp_path):
+    shopping_list = parse(tmp_path, "Fry @onion in @olive oil{2%tbsp}, then add @salt{}.\n")
+
+    assert shopping_list == [
+        {
+            "category": "other",
+            "items": [
+                {"name": "onion", "quantity": []},
+                {"name": "olive oil", "quantity": [number(2.0, "tbsp")]},
+                {"name": "salt", "quantity": []},
+            ],
+        }
+    ]
+
+
+def test_fixed_quantities_are_not_scaled(tmp_path):
+    shopping_list = parse(tmp_path, "Mix @flour{500%g} with @yeast{=1%tsp}.\n", "recipe.cook:2")
+
+    assert shopping_list[0]["items"] == [
+        {"name": "flour", "quantity": [number(1000.0, "g")]},
+        {"name": "yeast", "quantity": [number(1.0, "tsp")]},
+    ]
+
+
+def test_fractions(tmp_path):
+    shopping_list = parse(tmp_path, "Stir @milk{1 1/2%cups} into @sugar{1/2%cup}.\n")
+
+    assert shopping_list[0]["items"] == [
+        {"name": "milk", "quantity": [number(1.5, "cups")]},
+        {"name": "sugar", "quantity": [number(0.5, "cup")]},
+    ]
+
+
+def test_aliases_and_aisle_synonyms(tmp_path):
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "aisle.conf").write_text("[produce]\ngreen onion|scallion\ntomato\n")
+
+    shopping_list = parse(tmp_path, "Chop @tomato|tomatoes{2} and @scallion{3}.\n")
+
+    assert shopping_list == [
+        {
+            "category": "produce",
+            "items": [
+                {"name": "tomato", "quantity": [number(2.0)]},
+                {"name": "green onion", "quantity": [number(3.0)]},
+            ],
+        }
+    ]
+
+
+def test_comments_front_matter_and_metadata_are_ignored(tmp_path):
+    text = (
+        "---\ntitle: @frontmatter\n---\n"
+        ">> source: @metadata\n"
+        "> Note: @note\n"
+        "Boil @water. -- not @comment\n"
+        "[- @block\ncomment -]Drain.\n"
+    )
+
+    assert parse(tmp_path, text) == [
+        {"category": "other", "items": [{"name": "water", "quantity": []}]}
+    ]
+
+
+def test_recipe_references_are_unsupported(tmp_path):
+    for text in ("Add @./sauces/pesto{}.\n", "Add @&dough{}.\n"):
+        with pytest.raises(add_to_bring.UnsupportedRecipeError):
+            parse(tmp_path, text)
+
+
+def test_at_sign_inside_a_word_is_not_an_ingredient(tmp_path):
+    assert parse(tmp_path, "Questions? Mail chef@example.com and add @salt.\n") == [
+        {"category": "other", "items": [{"name": "salt", "quantity": []}]}
+    ]
+
+
+def test_fast_parser_runs_cook_once_for_unsupported_recipes(monkeypatch, tmp_path):
+    runs = count_cook_runs(monkeypatch, tmp_path)
+    (tmp_path / "a.cook").write_text("Chop @onion{1}.\n")
+    (tmp_path / "b.cook").write_text("Make @./dough{} first.\n")
+    (tmp_path / "c.cook").write_text("Add @&b{}.\n")
+
+    shopping_list = add_to_bring.generate_shopping_list(
+        ["a.cook", "b.cook", "c.cook"], tmp_path, fast_parser=True
+    )
+
+    assert runs == [["b.cook", "c.cook"]]
+    assert shopping_list == [
+        {"category": "other", "items": [{"name": "onion", "quantity": [number(1.0)]}]},
+        *SHOPPING_LIST,
+    ]
+
+
+def test_merged_quantities_are_rounded():
+    shopping_lists = [
+        [{"category": "dairy", "items": [{"name": "milk", "quantity": [number(0.1, "l")]}]}],
+        [{"category": "dairy", "items": [{"name": "milk", "quantity": [number(0.2, "l")]}]}],
+    ]
+
+    merged = add_to_bring._merge_shopping_lists(shopping_lists)
+
+    assert merged == [
+        {"category": "dairy", "items": [{"name": "milk", "quantity": [number(0.3, "l")]}]}
+    ]
+    assert add_to_bring.format_quantity(merged[0]["items"][0]["quantity"]) == "0.3 l"
+
+
+def test_duplicate_items_differing_in_case_are_merged():
+    shopping_list = [
+        {
+            "category": "dairy",
+            "items": [
+                {"name": "Milk", "quantity": [number(1.0, "l")]},
+                {"name": "milk ", "quantity": [number(0.5, "l"), number(200.0, "ml")]},
+                {"name": "butter", "quantity": []},
+            ],
+        }
+    ]
+
+    merged = add_to_bring.merge_duplicate_items(shopping_list)
+
+    assert merged == [
+        {
+            "category": "dairy",
+            "items": [
+                {"name": "Milk", "quantity": [number(1.5, "l"), number(200.0, "ml")]},
+                {"name": "butter", "quantity": []},
+            ],
+        }
+    ]